@@ -29,6 +29,8 @@ class DeviceLifeCycleConfig(PluginConfig):
         "barchart_bar_width": 0.1,
         "barchart_width": 12,
         "barchart_height": 5,
+        "chart_cache_timeout": 3600,
+        "api_list_cache_timeout": 0,
     }
     caching_config = {}
 
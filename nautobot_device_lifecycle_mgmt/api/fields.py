@@ -0,0 +1,51 @@
+"""API serializer fields for the Lifecycle Management plugin."""
+from nautobot.core.api import SerializedPKRelatedField
+from rest_framework import serializers
+
+
+class CachedHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+    """Hyperlinked identity field resolving its URL pattern once instead of once per object.
+
+    The first object rendered by the field reverses its view with a placeholder primary key; every object then
+    substitutes its own primary key into that URL instead of walking the URL resolver again. Field instances
+    are copied per serializer instance, so the cached URL never outlives the request it was built for.
+    """
+
+    pk_placeholder = "__pk__"
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the field without a cached URL."""
+        super().__init__(*args, **kwargs)
+        self._url_template = None
+
+    def get_url(self, obj, view_name, request, format):  # pylint: disable=redefined-builtin
+        """Return the URL of `obj`, reversing `view_name` only for the first object."""
+        if format or self.lookup_field != "pk":
+            return super().get_url(obj, view_name, request, format)
+        if obj.pk is None:
+            return None
+        if self._url_template is None:
+            self._url_template = self.reverse(
+                view_name, kwargs={self.lookup_url_kwarg: self.pk_placeholder}, request=request
+            )
+        return self._url_template.replace(self.pk_placeholder, str(obj.pk))
+
+
+class SharedSerializedPKRelatedField(SerializedPKRelatedField):
+    """Serialized primary key related field rendering every related object with the same serializer instance.
+
+    `SerializedPKRelatedField` instantiates its serializer, binding all of its fields, for each related object.
+    This field instantiates it for the first object and reuses it for the following ones, across all the rows
+    rendered by a list serializer.
+    """
+
+    def __init__(self, serializer, **kwargs):
+        """Initialize the field without a serializer instance."""
+        super().__init__(serializer, **kwargs)
+        self._serializer = None
+
+    def to_representation(self, value):
+        """Return the representation of `value` rendered by the shared serializer instance."""
+        if self._serializer is None:
+            self._serializer = self.serializer(context={"request": self.context["request"]})
+        return self._serializer.to_representation(value)
@@ -1,18 +1,16 @@
 """Nested/brief alternate REST API serializers for nautobot_device_lifecycle_mgmt models."""
 
-from rest_framework import serializers
-
 from nautobot.core.api import WritableNestedSerializer
 
 from nautobot_device_lifecycle_mgmt import models
 
+from .fields import CachedHyperlinkedIdentityField
+
 
 class NestedSoftwareLCMSerializer(WritableNestedSerializer):
     """Nested/brief serializer for SoftwareLCM."""
 
-    url = serializers.HyperlinkedIdentityField(
-        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:softwarelcm-detail"
-    )
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:softwarelcm-detail")
 
     class Meta:
         """Meta attributes."""
@@ -25,7 +23,7 @@ class NestedSoftwareLCMSerializer(WritableNestedSerializer):
 class NestedSoftwareImageLCMSerializer(WritableNestedSerializer):
     """Nested/brief serializer for SoftwareImageLCM."""
 
-    url = serializers.HyperlinkedIdentityField(
+    url = CachedHyperlinkedIdentityField(
         view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:softwareimagelcm-detail"
     )
 
@@ -89,7 +87,7 @@ class NestedContractLCMSerializer(WritableNestedSerializer):
 class NestedCVELCMSerializer(WritableNestedSerializer):
     """Nested serializer for the CVE class."""
 
-    url = serializers.HyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:cvelcm-detail")
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:cvelcm-detail")
 
     class Meta:
         """Meta magic method for the CVE nested serializer."""
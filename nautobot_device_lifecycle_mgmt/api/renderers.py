@@ -0,0 +1,41 @@
+"""API renderers for the Lifecycle Management plugin."""
+from rest_framework.renderers import JSONRenderer
+
+# orjson is an optional dependency, JSON is rendered by the standard library when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # pylint: disable=invalid-name
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer serializing with `orjson` when it is installed.
+
+    The output matches `JSONRenderer` for the API default settings (compact, non-ASCII JSON). Indented output,
+    as requested by the browsable API, and the ASCII-only or non-compact settings are left to `JSONRenderer`.
+    Values `orjson` doesn't serialize natively, datetimes included, go through the DRF JSON encoder, and data
+    `orjson` fails to serialize is rendered by `JSONRenderer`.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON, returning a bytestring."""
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects data the standard library serializes, like integers exceeding 64 bits.
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escape \u2028 and \u2029 like JSONRenderer, for the output to be a strict javascript subset.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
@@ -1,5 +1,10 @@
 """API serializers implementation for the LifeCycle Management plugin."""
-from nautobot.core.api import ChoiceField, SerializedPKRelatedField
+import copy
+
+from django.db import models
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
+from nautobot.core.api import ChoiceField
 from nautobot.dcim.api.nested_serializers import (
     NestedDeviceSerializer,
     NestedDeviceTypeSerializer,
@@ -13,6 +18,7 @@ from nautobot.extras.api.serializers import (
     TaggedObjectSerializer,
 )
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 
 # Nautobot 1.4 introduced RelationshipModelSerializerMixin
 # TODO: Remove this once plugin drops support for Nautobot < 1.4
@@ -27,6 +33,7 @@ try:
 except ImportError:
     serializer_base_classes = [TaggedObjectSerializer, CustomFieldModelSerializer]  # pylint: disable=invalid-name
 
+from nautobot.dcim.models import Device
 from nautobot.extras.models import Status
 
 from nautobot_device_lifecycle_mgmt import choices
@@ -42,6 +49,7 @@ from nautobot_device_lifecycle_mgmt.models import (
     VulnerabilityLCM,
 )
 
+from .fields import CachedHyperlinkedIdentityField, SharedSerializedPKRelatedField
 from .nested_serializers import (
     NestedContractLCMSerializer,
     NestedCVELCMSerializer,
@@ -51,16 +59,94 @@ from .nested_serializers import (
 )
 
 
-class HardwareLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,too-few-public-methods
+class CachedFieldsSerializerMixin:
+    """Build the fields of a model serializer once per serializer class.
+
+    `ModelSerializer.get_fields()` introspects the model and builds every field each time a serializer is
+    instantiated, although the result only depends on the serializer class. The fields are built on first use
+    and every serializer instance then gets its own copies to bind.
+
+    Binding only sets attributes on the field, so a shallow copy of a cached field is enough. Fields wrapping a
+    child field (list serializers and `many=True` related fields) bind that child to themselves when they are
+    initialized and are deep copied instead, for the child of the copy to point to the copy.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        """Return copies of the fields built for this serializer class."""
+        fields = self._fields_cache.get(type(self))
+        if fields is None:
+            fields = self._fields_cache.setdefault(type(self), super().get_fields())
+        return {
+            field_name: copy.deepcopy(field)
+            if hasattr(field, "child") or hasattr(field, "child_relation")
+            else copy.copy(field)
+            for field_name, field in fields.items()
+        }
+
+    @cached_property
+    def _readable_fields(self):
+        """Return the fields rendered by `to_representation()`, filtered once instead of once per object."""
+        return tuple(super()._readable_fields)
+
+
+class EagerLoadingSerializerMixin:
+    """Declare the related objects a serializer renders so that viewsets can load them up front.
+
+    Nested serializer fields backed by a forward relation belong in `select_related_fields`, fields backed by
+    a reverse or many-to-many relation belong in `prefetch_related_fields`. When adding a nested field to a
+    serializer using this mixin, add its lookup here as well, otherwise list endpoints issue a query per row.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def get_deferred_fields(cls):
+        """Return the names of the text columns of the serialized model that the serializer doesn't render.
+
+        Long text columns like `comments` are only shown in the UI, deferring them saves transferring them for
+        every row rendered by the API. The names are computed once per serializer class.
+        """
+        if "_deferred_fields" not in cls.__dict__:
+            cls._deferred_fields = tuple(
+                field.name
+                for field in cls.Meta.model._meta.concrete_fields
+                if isinstance(field, models.TextField) and field.name not in cls.Meta.fields
+            )
+        return cls._deferred_fields
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, request=None):
+        """Return `queryset` loading the related objects rendered by this serializer for `request`.
+
+        Serializers rendering related objects subject to the permissions of the requesting user extend this to
+        prefetch them with a queryset restricted to `request.user`.
+        """
+        deferred_fields = cls.get_deferred_fields()
+        if deferred_fields:
+            queryset = queryset.defer(*deferred_fields)
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
+
+
+class HardwareLCMSerializer(
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes
+):  # pylint: disable=R0901,too-few-public-methods
     """API serializer."""
 
-    url = serializers.HyperlinkedIdentityField(
-        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:hardwarelcm-detail"
-    )
+    select_related_fields = ("device_type__manufacturer",)
+    prefetch_related_fields = ("tags",)
+
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:hardwarelcm-detail")
     device_type = NestedDeviceTypeSerializer(
         many=False, read_only=False, required=True, help_text="Device Type to attach the Hardware LCM to"
     )
-    devices = NestedDeviceSerializer(many=True, read_only=True, required=False, help_text="Devices tied to Device Type")
+    devices = serializers.SerializerMethodField(help_text="Devices tied to Device Type")
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Meta attributes."""
@@ -83,13 +169,56 @@ class HardwareLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,
             "tags",
         ]
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the serializer without a resolved device URL."""
+        super().__init__(*args, **kwargs)
+        self._device_url_template = None
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, request=None):
+        """Also prefetch the IDs of the Device Type devices that `request.user` is allowed to view."""
+        queryset = super().setup_eager_loading(queryset, request=request)
+        if request is not None:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "device_type__instances",
+                    queryset=Device.objects.restrict(request.user, "view").only("id", "device_type_id"),
+                    to_attr="viewable_devices",
+                )
+            )
+        return queryset
+
+    def get_devices(self, obj):
+        """Return the ID and API URL of every device of the Device Type the requesting user is allowed to view."""
+        if obj.device_type is None:
+            return []
+        devices = getattr(obj.device_type, "viewable_devices", None)
+        if devices is None:
+            request = self.context.get("request")
+            if request is None:
+                return []
+            devices = obj.device_type.instances.restrict(request.user, "view").only("id")
+        if self._device_url_template is None:
+            self._device_url_template = reverse(
+                "dcim-api:device-detail",
+                kwargs={"pk": CachedHyperlinkedIdentityField.pk_placeholder},
+                request=self.context.get("request"),
+            )
+        return [
+            {
+                "id": device.pk,
+                "url": self._device_url_template.replace(CachedHyperlinkedIdentityField.pk_placeholder, str(device.pk)),
+            }
+            for device in devices
+        ]
+
 
-class ProviderLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,too-few-public-methods
+class ProviderLCMSerializer(
+    CachedFieldsSerializerMixin, *serializer_base_classes
+):  # pylint: disable=R0901,too-few-public-methods
     """API serializer."""
 
-    url = serializers.HyperlinkedIdentityField(
-        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:providerlcm-detail"
-    )
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:providerlcm-detail")
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Meta attributes."""
@@ -109,12 +238,15 @@ class ProviderLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,
         ]
 
 
-class ContractLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,too-few-public-methods
+class ContractLCMSerializer(
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes
+):  # pylint: disable=R0901,too-few-public-methods
     """API serializer."""
 
-    url = serializers.HyperlinkedIdentityField(
-        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:contractlcm-detail"
-    )
+    select_related_fields = ("provider",)
+    prefetch_related_fields = ("tags",)
+
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:contractlcm-detail")
     provider = NestedProviderLCMSerializer(many=False, read_only=False, required=True, help_text="Vendor")
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -137,12 +269,15 @@ class ContractLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,
         ]
 
 
-class ContactLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,too-few-public-methods
+class ContactLCMSerializer(
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes
+):  # pylint: disable=R0901,too-few-public-methods
     """API serializer."""
 
-    url = serializers.HyperlinkedIdentityField(
-        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:contactlcm-detail"
-    )
+    select_related_fields = ("contract__provider",)
+    prefetch_related_fields = ("tags",)
+
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:contactlcm-detail")
     contract = NestedContractLCMSerializer(many=False, read_only=False, required=True, help_text="Associated Contract")
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -163,14 +298,22 @@ class ContactLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,t
         ]
 
 
-class SoftwareLCMSerializer(*serializer_base_classes):  # pylint: disable=too-few-public-methods
+class SoftwareLCMSerializer(
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes
+):  # pylint: disable=too-few-public-methods
     """REST API serializer for SoftwareLCM records."""
 
-    url = serializers.HyperlinkedIdentityField(
-        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:softwarelcm-detail"
+    select_related_fields = ("device_platform",)
+    prefetch_related_fields = (
+        "software_images__device_types",
+        "software_images__inventory_items",
+        "software_images__object_tags",
+        "tags",
     )
+
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:softwarelcm-detail")
     device_platform = NestedPlatformSerializer()
-    software_images = SerializedPKRelatedField(
+    software_images = SharedSerializedPKRelatedField(
         queryset=SoftwareImageLCM.objects.all(),
         serializer=NestedSoftwareImageLCMSerializer,
         required=False,
@@ -198,10 +341,15 @@ class SoftwareLCMSerializer(*serializer_base_classes):  # pylint: disable=too-fe
         ]
 
 
-class SoftwareImageLCMSerializer(*serializer_base_classes):  # pylint: disable=too-few-public-methods
+class SoftwareImageLCMSerializer(
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes
+):  # pylint: disable=too-few-public-methods
     """REST API serializer for SoftwareImageLCM records."""
 
-    url = serializers.HyperlinkedIdentityField(
+    select_related_fields = ("software__device_platform",)
+    prefetch_related_fields = ("device_types", "inventory_items", "object_tags", "tags")
+
+    url = CachedHyperlinkedIdentityField(
         view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:softwareimagelcm-detail"
     )
     software = NestedSoftwareLCMSerializer()
@@ -226,10 +374,15 @@ class SoftwareImageLCMSerializer(*serializer_base_classes):  # pylint: disable=t
         ]
 
 
-class ValidatedSoftwareLCMSerializer(*serializer_base_classes):  # pylint: disable=too-few-public-methods
+class ValidatedSoftwareLCMSerializer(
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes
+):  # pylint: disable=too-few-public-methods
     """REST API serializer for ValidatedSoftwareLCM records."""
 
-    url = serializers.HyperlinkedIdentityField(
+    select_related_fields = ("software__device_platform",)
+    prefetch_related_fields = ("devices", "device_types", "device_roles", "inventory_items", "object_tags", "tags")
+
+    url = CachedHyperlinkedIdentityField(
         view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:validatedsoftwarelcm-detail"
     )
     software = NestedSoftwareLCMSerializer()
@@ -256,10 +409,15 @@ class ValidatedSoftwareLCMSerializer(*serializer_base_classes):  # pylint: disab
         ]
 
 
-class CVELCMSerializer(*serializer_base_classes, StatusModelSerializerMixin):  # pylint: disable=abstract-method
+class CVELCMSerializer(
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes, StatusModelSerializerMixin
+):  # pylint: disable=abstract-method
     """REST API serializer for CVELCM records."""
 
-    url = serializers.HyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:cvelcm-detail")
+    select_related_fields = ("status",)
+    prefetch_related_fields = ("tags",)
+
+    url = CachedHyperlinkedIdentityField(view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:cvelcm-detail")
     status = StatusSerializerField(required=False, queryset=Status.objects.all())
     severity = ChoiceField(choices=choices.CVESeverityChoices, required=False)
 
@@ -287,11 +445,14 @@ class CVELCMSerializer(*serializer_base_classes, StatusModelSerializerMixin):  #
 
 
 class VulnerabilityLCMSerializer(
-    *serializer_base_classes, StatusModelSerializerMixin
+    CachedFieldsSerializerMixin, EagerLoadingSerializerMixin, *serializer_base_classes, StatusModelSerializerMixin
 ):  # pylint: disable=abstract-method
     """REST API serializer for VulnerabilityLCM records."""
 
-    url = serializers.HyperlinkedIdentityField(
+    select_related_fields = ("cve", "software__device_platform", "device", "inventory_item__device", "status")
+    prefetch_related_fields = ("tags",)
+
+    url = CachedHyperlinkedIdentityField(
         view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:vulnerabilitylcm-detail"
     )
     cve = NestedCVELCMSerializer(read_only=True)
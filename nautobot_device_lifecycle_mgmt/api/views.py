@@ -1,5 +1,10 @@
 """API Views implementation for the Lifecycle Management plugin."""
 
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
 from nautobot.core.api.views import ModelViewSet
 from nautobot.extras.api.views import CustomFieldModelViewSet
 
@@ -25,7 +30,10 @@ from nautobot_device_lifecycle_mgmt.filters import (
     CVELCMFilterSet,
     VulnerabilityLCMFilterSet,
 )
+from nautobot_device_lifecycle_mgmt.const import PLUGIN_CFG
+from nautobot_device_lifecycle_mgmt.utils import get_list_cache_key
 
+from .renderers import ORJSONRenderer
 from .serializers import (
     HardwareLCMSerializer,
     ContractLCMSerializer,
@@ -38,76 +46,122 @@ from .serializers import (
     VulnerabilityLCMSerializer,
 )
 
+# The API renderers with JSON rendered by orjson.
+RENDERER_CLASSES = [
+    ORJSONRenderer if renderer_class is JSONRenderer else renderer_class
+    for renderer_class in api_settings.DEFAULT_RENDERER_CLASSES
+]
+
+
+class EagerLoadingViewSetMixin:  # pylint: disable=too-few-public-methods
+    """Apply the eager loading declared by the viewset serializer to the viewset queryset."""
+
+    def get_queryset(self):
+        """Return the queryset with the related objects used by `serializer_class` loaded up front."""
+        return self.serializer_class.setup_eager_loading(super().get_queryset(), request=self.request)
+
+
+class CachedListViewSetMixin:  # pylint: disable=too-few-public-methods
+    """Cache the data of the viewset list responses until an object of the viewset model is saved or deleted.
+
+    Caching is enabled by setting the plugin `api_list_cache_timeout` setting to a number of seconds. The model
+    must have its cached responses invalidated by `post_save`/`post_delete` signal handlers, see `signals.py`.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """Return the cached list response data for `request`, rendering and caching it on a cache miss."""
+        timeout = PLUGIN_CFG.get("api_list_cache_timeout")
+        if not timeout:
+            return super().list(request, *args, **kwargs)
+
+        cache_key = get_list_cache_key(self.queryset.model, request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, timeout)
+        return response
+
 
-class HardwareLCMView(ModelViewSet):
+class HardwareLCMView(CachedListViewSetMixin, EagerLoadingViewSetMixin, ModelViewSet):
     """CRUD operations set for the Hardware Lifecycle Management view."""
 
     queryset = HardwareLCM.objects.all()
     filterset_class = HardwareLCMFilterSet
     serializer_class = HardwareLCMSerializer
+    renderer_classes = RENDERER_CLASSES
 
 
-class ContractLCMView(ModelViewSet):
+class ContractLCMView(CachedListViewSetMixin, EagerLoadingViewSetMixin, ModelViewSet):
     """CRUD operations set for the Contract Lifecycle Management view."""
 
     queryset = ContractLCM.objects.all()
     filterset_class = ContractLCMFilterSet
     serializer_class = ContractLCMSerializer
+    renderer_classes = RENDERER_CLASSES
 
 
-class ProviderLCMView(ModelViewSet):
+class ProviderLCMView(CachedListViewSetMixin, ModelViewSet):
     """CRUD operations set for the Contract Provider Lifecycle Management view."""
 
     queryset = ProviderLCM.objects.all()
     filterset_class = ProviderLCMFilterSet
     serializer_class = ProviderLCMSerializer
+    renderer_classes = RENDERER_CLASSES
 
 
-class ContactLCMView(ModelViewSet):
+class ContactLCMView(EagerLoadingViewSetMixin, ModelViewSet):
     """CRUD operations set for the Contact Lifecycle Management view."""
 
     queryset = ContactLCM.objects.all()
     filterset_class = ContactLCMFilterSet
     serializer_class = ContactLCMSerializer
+    renderer_classes = RENDERER_CLASSES
 
 
-class SoftwareLCMViewSet(CustomFieldModelViewSet):
+class SoftwareLCMViewSet(EagerLoadingViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for SoftwareLCM records."""
 
-    queryset = SoftwareLCM.objects.prefetch_related("software_images")
+    queryset = SoftwareLCM.objects.all()
     serializer_class = SoftwareLCMSerializer
+    renderer_classes = RENDERER_CLASSES
     filterset_class = SoftwareLCMFilterSet
 
 
-class SoftwareImageLCMViewSet(CustomFieldModelViewSet):
+class SoftwareImageLCMViewSet(EagerLoadingViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for SoftwareImageLCM records."""
 
-    queryset = SoftwareImageLCM.objects.prefetch_related("software")
+    queryset = SoftwareImageLCM.objects.all()
     serializer_class = SoftwareImageLCMSerializer
+    renderer_classes = RENDERER_CLASSES
     filterset_class = SoftwareImageLCMFilterSet
 
 
-class ValidatedSoftwareLCMViewSet(CustomFieldModelViewSet):
+class ValidatedSoftwareLCMViewSet(EagerLoadingViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for ValidatedSoftwareLCM records."""
 
     queryset = ValidatedSoftwareLCM.objects.all()
     serializer_class = ValidatedSoftwareLCMSerializer
+    renderer_classes = RENDERER_CLASSES
     filterset_class = ValidatedSoftwareLCMFilterSet
 
 
-class CVELCMViewSet(CustomFieldModelViewSet):
+class CVELCMViewSet(EagerLoadingViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for CVELCM records."""
 
     queryset = CVELCM.objects.all()
     serializer_class = CVELCMSerializer
+    renderer_classes = RENDERER_CLASSES
     filterset_class = CVELCMFilterSet
 
 
-class VulnerabilityLCMViewSet(CustomFieldModelViewSet):
+class VulnerabilityLCMViewSet(EagerLoadingViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for VulnerabilityLCM records."""
 
     queryset = VulnerabilityLCM.objects.all()
     serializer_class = VulnerabilityLCMSerializer
+    renderer_classes = RENDERER_CLASSES
     filterset_class = VulnerabilityLCMFilterSet
 
     # Disabling POST as these should only be created via Job.
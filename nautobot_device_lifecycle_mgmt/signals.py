@@ -1,11 +1,14 @@
 """Custom signals for the Lifecycle Management plugin."""
 
 from django.apps import apps as global_apps
-from django.db.models.signals import pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from nautobot.extras.choices import RelationshipTypeChoices
-from nautobot.extras.models import Relationship, RelationshipAssociation
+from nautobot.extras.models import Relationship, RelationshipAssociation, TaggedItem
+
+from nautobot_device_lifecycle_mgmt.models import ContractLCM, HardwareLCM, ProviderLCM
+from nautobot_device_lifecycle_mgmt.utils import invalidate_list_cache
 
 
 def post_migrate_create_relationships(sender, apps=global_apps, **kwargs):  # pylint: disable=unused-argument
@@ -103,3 +106,29 @@ def delete_cve_to_software_relationships(sender, instance, **kwargs):  # pylint:
     """Delete all CVELCM relationships to SoftwareLCM objects."""
     soft_relationships = Relationship.objects.filter(slug__in=("cve_soft"))
     RelationshipAssociation.objects.filter(relationship__in=soft_relationships, source_id=instance.pk).delete()
+
+
+@receiver([post_save, post_delete], sender=HardwareLCM)
+def invalidate_hardwarelcm_list_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached HardwareLCM API list responses."""
+    invalidate_list_cache(HardwareLCM)
+
+
+@receiver([post_save, post_delete], sender=ContractLCM)
+def invalidate_contractlcm_list_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached ContractLCM API list responses."""
+    invalidate_list_cache(ContractLCM)
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def invalidate_tagged_list_cache(sender, instance, action, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached HardwareLCM or ContractLCM API list responses when the tags of an object change."""
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(instance, (HardwareLCM, ContractLCM)):
+        invalidate_list_cache(type(instance))
+
+
+@receiver([post_save, post_delete], sender=ProviderLCM)
+def invalidate_providerlcm_list_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached ProviderLCM API list responses, as well as the ContractLCM ones nesting providers."""
+    invalidate_list_cache(ProviderLCM)
+    invalidate_list_cache(ContractLCM)
@@ -1,12 +1,20 @@
 """Unit tests for nautobot_device_lifecycle_mgmt."""
 import datetime
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
 
 from nautobot.utilities.testing import APIViewTestCases
 from nautobot.dcim.models import DeviceType, Manufacturer, Platform, Device, DeviceRole, InventoryItem, Site
 from nautobot.extras.models import Status, Tag
 
+from nautobot_device_lifecycle_mgmt.api.renderers import ORJSONRenderer
+from nautobot_device_lifecycle_mgmt.const import PLUGIN_CFG
 from nautobot_device_lifecycle_mgmt.models import (
     HardwareLCM,
     SoftwareLCM,
@@ -84,6 +92,83 @@ class HardwareLCMAPITest(APIViewTestCases.APIViewTestCase):
     def test_list_objects_brief(self):
         """Nautobot 1.4 adds 'created' and 'last_updated' causing testing mismatch with previous versions."""
 
+    def test_devices_of_device_type(self):
+        """Test that the devices of the Device Type are listed by ID and URL."""
+        devices = create_devices()
+        hardware_lcm = HardwareLCM.objects.create(
+            device_type=devices[0].device_type, end_of_sale=datetime.date(2021, 4, 1)
+        )
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_hardwarelcm", "dcim.view_device")
+
+        response = self.client.get(self._get_detail_url(hardware_lcm), **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            sorted(device["id"] for device in response.json()["devices"]), sorted(str(device.pk) for device in devices)
+        )
+        for device in response.json()["devices"]:
+            self.assertTrue(device["url"].endswith(f"/api/dcim/devices/{device['id']}/"))
+
+    def test_devices_of_device_type_restricted(self):
+        """Test that only the devices the user is allowed to view are listed."""
+        devices = create_devices()
+        self.add_permissions(
+            "nautobot_device_lifecycle_mgmt.add_hardwarelcm", "nautobot_device_lifecycle_mgmt.view_hardwarelcm"
+        )
+
+        # Responses to create requests don't use the prefetched devices.
+        response = self.client.post(
+            self._get_list_url(),
+            {"device_type": str(devices[0].device_type.pk), "end_of_sale": "2021-04-01"},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 201)
+        self.assertEqual(response.json()["devices"], [])
+
+        response = self.client.get(self._get_list_url(), **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["devices"] for result in response.json()["results"]], [[]] * 4)
+
+    @mock.patch.dict(PLUGIN_CFG, {"api_list_cache_timeout": 60})
+    def test_list_objects_cached_tags(self):
+        """Test that cached list responses are invalidated when the tags of a HardwareLCM change."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_hardwarelcm")
+        hardware_lcm = HardwareLCM.objects.first()
+        tag = Tag.objects.create(name="eox", slug="eox")
+        url = self._get_list_url()
+
+        self.assertHttpStatus(self.client.get(url, **self.header), 200)
+        hardware_lcm.tags.add(tag)
+        response = self.client.get(url, **self.header)
+        self.assertIn(
+            [str(tag.pk)],
+            [[result_tag["id"] for result_tag in result["tags"]] for result in response.json()["results"]],
+        )
+
+        hardware_lcm.tags.clear()
+        response = self.client.get(url, **self.header)
+        self.assertEqual([result["tags"] for result in response.json()["results"]], [[]] * 3)
+
+    def test_list_objects_query_count(self):
+        """Test that listing HardwareLCM objects doesn't run additional queries per row."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_hardwarelcm")
+        url = self._get_list_url()
+        # Warm up the per-process caches (content types, custom fields) before counting.
+        self.client.get(url, **self.header)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertHttpStatus(self.client.get(url, **self.header), 200)
+
+        for i in range(4):
+            manufacturer = Manufacturer.objects.create(name=f"Manufacturer {i}", slug=f"manufacturer-{i}")
+            device_type = DeviceType.objects.create(model=f"Model {i}", slug=f"model-{i}", manufacturer=manufacturer)
+            HardwareLCM.objects.create(device_type=device_type, end_of_sale=datetime.date(2021, 4, 1))
+
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get(url, **self.header)
+        self.assertEqual(response.json()["count"], 7)
+
 
 class SoftwareLCMAPITest(APIViewTestCases.APIViewTestCase):
     """Test the SoftwareLCM API."""
@@ -148,6 +233,23 @@ class SoftwareLCMAPITest(APIViewTestCases.APIViewTestCase):
         """Currently don't support notes."""
 
 
+class ProviderLCMAPITest(APIViewTestCases.GetObjectViewTestCase, APIViewTestCases.ListObjectsViewTestCase):
+    """Test the ProviderLCM API."""
+
+    model = ProviderLCM
+    brief_fields = ["comments", "description", "display", "email", "id", "name", "phone", "physical_address"]
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create ProviderLCM objects."""
+        ProviderLCM.objects.create(name="Cisco", email="email@cisco.com")
+        ProviderLCM.objects.create(name="Juniper", email="email@juniper.net")
+        ProviderLCM.objects.create(name="Arista", email="email@arista.com")
+
+    def test_list_objects_brief(self):
+        """Nautobot 1.4 adds 'created' and 'last_updated' causing testing mismatch with previous versions."""
+
+
 class ContractLCMAPITest(APIViewTestCases.APIViewTestCase):
     """Test the ContractLCM API."""
 
@@ -239,6 +341,27 @@ class ContractLCMAPITest(APIViewTestCases.APIViewTestCase):
     def test_notes_url_on_object(self):
         """Currently don't support notes."""
 
+    @mock.patch.dict(PLUGIN_CFG, {"api_list_cache_timeout": 60})
+    def test_list_objects_cached(self):
+        """Test that list responses are cached until a ContractLCM or ProviderLCM is saved."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_contractlcm")
+        contract = ContractLCM.objects.get(name="Meraki Hardware Support")
+        url = self._get_list_url()
+
+        self.assertHttpStatus(self.client.get(url, **self.header), 200)
+        # Queryset updates don't send signals, the cached response is returned.
+        ContractLCM.objects.filter(pk=contract.pk).update(support_level="8-5, M-F")
+        response = self.client.get(url, **self.header)
+        self.assertNotIn("8-5, M-F", [result["support_level"] for result in response.json()["results"]])
+
+        contract.provider.save()
+        response = self.client.get(url, **self.header)
+        self.assertIn("8-5, M-F", [result["support_level"] for result in response.json()["results"]])
+
+        # Responses are cached per query parameters.
+        response = self.client.get(f"{url}?name=Meraki Software Support", **self.header)
+        self.assertEqual([result["name"] for result in response.json()["results"]], ["Meraki Software Support"])
+
 
 class ValidatedSoftwareLCMAPITest(APIViewTestCases.APIViewTestCase):
     """Test the SoftwareLCM API."""
@@ -674,3 +797,16 @@ class SoftwareImageLCMAPITest(APIViewTestCases.APIViewTestCase):
 
     def test_notes_url_on_object(self):
         """Currently don't support notes."""
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """Test the ORJSONRenderer."""
+
+    def test_render_matches_json_renderer(self):
+        """Test that the rendered JSON matches the JSONRenderer output, including data orjson can't serialize."""
+        for data in (
+            {"id": 1, "name": "Cisco\u2028IOS", "end_of_sale": datetime.date(2021, 4, 1)},
+            {"id": 2**70},
+        ):
+            with self.subTest(data=data):
+                self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
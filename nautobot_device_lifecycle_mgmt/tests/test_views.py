@@ -1,15 +1,22 @@
 """Unit tests for views."""
 import datetime
+import urllib
+from decimal import Decimal
+from unittest import mock
+from xml.etree import ElementTree
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase
 from django.urls import reverse
 
 from nautobot.utilities.testing import ViewTestCases
-from nautobot.dcim.models import DeviceType, Manufacturer
+from nautobot.dcim.models import Device, DeviceType, InventoryItem, Manufacturer
 from nautobot.users.models import ObjectPermission
 from nautobot.extras.models import Status
 
+from nautobot_device_lifecycle_mgmt import choices
 from nautobot_device_lifecycle_mgmt.models import (
     HardwareLCM,
     DeviceSoftwareValidationResult,
@@ -18,6 +25,11 @@ from nautobot_device_lifecycle_mgmt.models import (
     VulnerabilityLCM,
     SoftwareImageLCM,
 )
+from nautobot_device_lifecycle_mgmt.views import (
+    DEVICE_BAR_CHART_ATTRS,
+    ReportOverviewHelper,
+    ValidatedSoftwareDeviceReportView,
+)
 from .conftest import create_devices, create_inventory_items, create_cves, create_softwares
 
 User = get_user_model()
@@ -58,6 +70,20 @@ class HardwareLCMViewTest(ViewTestCases.PrimaryObjectViewTestCase):
             "c9200-48, 2023-10-06, 2024-10-06, 2025-10-06, 2026-10-06, https://cisco.com/eox",
         )
 
+    def test_inventory_item_devices_listed_once(self):
+        """Test that a device with several inventory items of the notice part is listed once."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_hardwarelcm", "dcim.view_device")
+        inventory_item = create_inventory_items()[0]
+        InventoryItem.objects.create(device=inventory_item.device, name="SUP2T Card 2", part_id=inventory_item.part_id)
+        hardware_notice = HardwareLCM.objects.create(
+            inventory_item=inventory_item.part_id, end_of_sale=datetime.date(2021, 4, 1)
+        )
+
+        response = self.client.get(hardware_notice.get_absolute_url())
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(list(response.context["devices"]), [inventory_item.device])
+
     def test_has_advanced_tab(self):
         pass
 
@@ -115,6 +141,61 @@ class ValidatedSoftwareDeviceReportViewTest(ViewTestCases.ListObjectsViewTestCas
             200,
         )
 
+    def test_validation_report_global_aggregation(self):
+        """Test that the global report counts all devices, including the ones without platform."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        Device.objects.filter(pk=DeviceSoftwareValidationResult.objects.first().device.pk).update(platform=None)
+
+        response = self.client.get(reverse("plugins:nautobot_device_lifecycle_mgmt:validatedsoftware_device_report"))
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            response.context["device_aggr"],
+            {"total": 2, "valid": 0, "invalid": 0, "no_software": 2, "name": "Devices", "valid_percent": 0},
+        )
+
+    def test_validation_report_valid_percent(self):
+        """Test that the valid percentage of device types is rounded to two decimals instead of truncated."""
+        DeviceSoftwareValidationResult.objects.create(
+            device=Device.objects.get(device_software_validation__isnull=True),
+            software=None,
+            is_validated=True,
+        )
+
+        self.assertEqual(
+            list(ValidatedSoftwareDeviceReportView.queryset.values_list("total", "valid", "valid_percent")),
+            [(3, 1, Decimal("33.33"))],
+        )
+
+    def test_validation_report_invalid_excludes_no_software(self):
+        """Test that only the results with a software are counted as invalid, in a single query."""
+        DeviceSoftwareValidationResult.objects.create(
+            device=Device.objects.get(device_software_validation__isnull=True),
+            software=create_softwares()[0],
+            is_validated=False,
+        )
+
+        with self.assertNumQueries(1):
+            rows = list(ValidatedSoftwareDeviceReportView.queryset.values_list("total", "invalid", "no_software"))
+        self.assertEqual(rows, [(3, 1, 2)])
+
+    def test_report_last_run_cached(self):
+        """Test that the time of the last full run of the report is cached."""
+        cache_key = "nautobot_device_lifecycle_mgmt:devicesoftwarevalidationresult:last_run"
+        cache.delete(cache_key)
+        self.addCleanup(cache.delete, cache_key)
+        last_run = datetime.datetime(2022, 5, 1, tzinfo=datetime.timezone.utc)
+        DeviceSoftwareValidationResult.objects.update(
+            run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN, last_run=last_run
+        )
+
+        self.assertEqual(ReportOverviewHelper.get_report_last_run(DeviceSoftwareValidationResult), last_run)
+        DeviceSoftwareValidationResult.objects.update(last_run=last_run + datetime.timedelta(days=1))
+        self.assertEqual(ReportOverviewHelper.get_report_last_run(DeviceSoftwareValidationResult), last_run)
+
     def test_get_object_notes(self):
         pass
 
@@ -184,6 +265,37 @@ class ValidatedSoftwareInventoryItemReportViewTest(ViewTestCases.ListObjectsView
         pass
 
 
+class ReportOverviewHelperTest(TestCase):
+    """Test ReportOverviewHelper charts."""
+
+    pie_chart_attrs = {
+        "aggr_labels": ["valid", "invalid", "no_software"],
+        "chart_labels": ["Valid", "Invalid", "No Software"],
+    }
+
+    @mock.patch.object(ReportOverviewHelper, "render_piechart_visual", return_value="chart")
+    def test_piechart_cached_per_aggregation(self, render_piechart_visual):
+        """Test that a pie chart is only rendered again when its aggregation changes."""
+        aggr = {"name": "Cached Devices", "total": 3, "valid": 1, "invalid": 1, "no_software": 1}
+
+        self.assertEqual(ReportOverviewHelper.plot_piechart_visual(aggr, self.pie_chart_attrs), "chart")
+        self.assertEqual(ReportOverviewHelper.plot_piechart_visual(dict(aggr), self.pie_chart_attrs), "chart")
+        render_piechart_visual.assert_called_once()
+
+        ReportOverviewHelper.plot_piechart_visual({**aggr, "valid": 2}, self.pie_chart_attrs)
+        self.assertEqual(render_piechart_visual.call_count, 2)
+
+    def test_barchart_svg_escapes_labels(self):
+        """Test that bar charts are rendered as SVG documents with their labels escaped."""
+        chart = ReportOverviewHelper.render_barchart_visual(
+            [("<IOS & NX-OS>", 2, 1, 0), (None, 0, 0, 3)], DEVICE_BAR_CHART_ATTRS
+        )
+
+        svg = ElementTree.fromstring(urllib.parse.unquote(chart))
+        self.assertEqual(svg.tag, "{http://www.w3.org/2000/svg}svg")
+        self.assertIn("<IOS & NX-OS>", [text.text for text in svg.iter("{http://www.w3.org/2000/svg}text")])
+
+
 class CVELCMViewTest(ViewTestCases.PrimaryObjectViewTestCase):
     """Test the CVELCM views."""
 
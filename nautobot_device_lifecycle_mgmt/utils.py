@@ -1,4 +1,8 @@
 """Utility functions and classes used by the plugin."""
+import hashlib
+import uuid
+
+from django.core.cache import cache
 from django.db.models import Count, Subquery, OuterRef
 from django.db.models.functions import Coalesce
 
@@ -8,3 +12,34 @@ def count_related_m2m(model, field):
     subquery = Subquery(model.objects.filter(**{"pk": OuterRef("pk")}).order_by().annotate(c=Count(field)).values("c"))
 
     return Coalesce(subquery, 0)
+
+
+def _list_cache_version_key(model):
+    """Return the cache key holding the current version of the cached API list responses of `model`."""
+    return f"dlm:list:{model._meta.label_lower}:version"
+
+
+def get_list_cache_key(model, request):
+    """Return the cache key of the API list response of `model` rendered for `request`.
+
+    The key covers everything the rendered data depends on besides the database content: the requesting user
+    (object permissions), the API version, the host the hyperlinks are built for and the query parameters
+    (filters and pagination). It also embeds the version of the `model` responses, so bumping that version with
+    `invalidate_list_cache` makes every previously cached response unreachable.
+    """
+    version_key = _list_cache_version_key(model)
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.add(version_key, version, None)
+        version = cache.get(version_key, version)
+    params = hashlib.sha256(repr(sorted(request.query_params.lists())).encode()).hexdigest()
+    return (
+        f"dlm:list:{model._meta.label_lower}:{version}:{request.user.pk}:{request.version}:"
+        f"{request.build_absolute_uri('/')}:{params}"
+    )
+
+
+def invalidate_list_cache(model):
+    """Invalidate all cached API list responses of `model`."""
+    cache.set(_list_cache_version_key(model), uuid.uuid4().hex, None)
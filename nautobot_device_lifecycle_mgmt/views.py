@@ -1,14 +1,16 @@
 """Views implementation for the Lifecycle Management plugin."""
-import base64
-import io
+import hashlib
+import itertools
+import json
 import logging
+import math
 import urllib
+from types import MappingProxyType
+from xml.sax.saxutils import escape
 
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MaxNLocator
-import numpy as np
-
-from django.db.models import Q, F, Count, ExpressionWrapper, FloatField
+from django.core.cache import cache
+from django.db.models import Q, F, Case, Count, DecimalField, When
+from django.db.models.functions import Cast
 from django_tables2 import RequestConfig
 
 from nautobot.core.views import generic
@@ -101,12 +103,55 @@ logger = logging.getLogger("nautobot_device_lifecycle_mgmt")
 #  Hardware Lifecycle Management Views
 # ---------------------------------------------------------------------------------
 GREEN, RED, GREY = ("#D5E8D4", "#F8CECC", "#808080")
+# Percentage of valid results of a report aggregation, rounded to two decimals. The division is done on floats,
+# instead of truncated to an integer, and by 1 instead of 0 for aggregations without results.
+VALID_PERCENT = Cast(
+    100.0 * F("valid") / Case(When(total=0, then=1), default=F("total")),
+    output_field=DecimalField(max_digits=5, decimal_places=2),
+)
+# Chart attributes of the reports, shared by all the requests and therefore read-only.
+REPORT_PIE_CHART_ATTRS = MappingProxyType(
+    {
+        "aggr_labels": ("valid", "invalid", "no_software"),
+        "chart_labels": ("Valid", "Invalid", "No Software"),
+    }
+)
+REPORT_CHART_BARS = (
+    MappingProxyType({"label": "Valid", "data_attr": "valid", "color": GREEN}),
+    MappingProxyType({"label": "Invalid", "data_attr": "invalid", "color": RED}),
+    MappingProxyType({"label": "No Software", "data_attr": "no_software", "color": GREY}),
+)
+DEVICE_BAR_CHART_ATTRS = MappingProxyType(
+    {
+        "label_accessor": "device__platform__name",
+        "ylabel": "Device",
+        "title": "Valid per Platform",
+        "chart_bars": REPORT_CHART_BARS,
+    }
+)
+INVENTORY_ITEM_BAR_CHART_ATTRS = MappingProxyType(
+    {
+        "label_accessor": "inventory_item__manufacturer__name",
+        "ylabel": "Inventory Item",
+        "title": "Valid per Manufacturer",
+        "chart_bars": REPORT_CHART_BARS,
+    }
+)
+# Number of seconds the time of the last full run of a report is cached for.
+REPORT_LAST_RUN_CACHE_TIMEOUT = 60
+# Report charts are SVG images, sized in pixels for the figure sizes in inches of the plugin settings.
+CHART_DPI = 100
+CHART_FONT_SIZE = 14
+CHART_TITLE_FONT_SIZE = 17
+PIE_CHART_SIZE = (640, 480)
+BARCHART_BAR_WIDTH = PLUGIN_CFG["barchart_bar_width"]
+BARCHART_SIZE = (PLUGIN_CFG["barchart_width"] * CHART_DPI, PLUGIN_CFG["barchart_height"] * CHART_DPI)
 
 
 class HardwareLCMListView(generic.ObjectListView):
     """List view."""
 
-    queryset = HardwareLCM.objects.prefetch_related("device_type")
+    queryset = HardwareLCM.objects.select_related("device_type")
     filterset = HardwareLCMFilterSet
     filterset_form = HardwareLCMFilterForm
     table = HardwareLCMTable
@@ -115,7 +160,7 @@ class HardwareLCMListView(generic.ObjectListView):
 class HardwareLCMView(generic.ObjectView):
     """Detail view."""
 
-    queryset = HardwareLCM.objects.prefetch_related("device_type")
+    queryset = HardwareLCM.objects.select_related("device_type")
 
     def get_extra_context(self, request, instance):
         """Return any additional context data for the template.
@@ -123,14 +168,15 @@ class HardwareLCMView(generic.ObjectView):
         request: The current request
         instance: The object being viewed
         """
+        # Unnamed devices are displayed with their virtual chassis or their device type and its manufacturer.
+        devices = Device.objects.restrict(request.user, "view").select_related(
+            "device_type__manufacturer", "virtual_chassis"
+        )
         if instance.device_type:
-            return {"devices": Device.objects.restrict(request.user, "view").filter(device_type=instance.device_type)}
+            return {"devices": devices.filter(device_type=instance.device_type)}
         if instance.inventory_item:
-            return {
-                "devices": Device.objects.restrict(request.user, "view").filter(
-                    inventoryitems__part_id=instance.inventory_item
-                )
-            }
+            # A device with several inventory items of the part would be joined once per item.
+            return {"devices": devices.filter(inventoryitems__part_id=instance.inventory_item).distinct()}
         return {"devices": []}
 
 
@@ -138,7 +184,7 @@ class HardwareLCMCreateView(generic.ObjectEditView):
     """Create view."""
 
     model = HardwareLCM
-    queryset = HardwareLCM.objects.prefetch_related("device_type")
+    queryset = HardwareLCM.objects.select_related("device_type")
     model_form = HardwareLCMForm
     template_name = "nautobot_device_lifecycle_mgmt/hardwarelcm_edit.html"
     default_return_url = "plugins:nautobot_device_lifecycle_mgmt:hardwarelcm_list"
@@ -148,7 +194,7 @@ class HardwareLCMDeleteView(generic.ObjectDeleteView):
     """Delete view."""
 
     model = HardwareLCM
-    queryset = HardwareLCM.objects.prefetch_related("device_type")
+    queryset = HardwareLCM.objects.select_related("device_type")
     default_return_url = "plugins:nautobot_device_lifecycle_mgmt:hardwarelcm_list"
 
 
@@ -156,7 +202,7 @@ class HardwareLCMEditView(generic.ObjectEditView):
     """Edit view."""
 
     model = HardwareLCM
-    queryset = HardwareLCM.objects.prefetch_related("device_type")
+    queryset = HardwareLCM.objects.select_related("device_type")
     model_form = HardwareLCMForm
     template_name = "nautobot_device_lifecycle_mgmt/hardwarelcm_edit.html"
     default_return_url = "plugins:nautobot_device_lifecycle_mgmt:hardwarelcm"
@@ -405,21 +451,91 @@ class ReportOverviewHelper(ContentTypePermissionRequiredMixin, generic.View):
         return "nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm"
 
     @staticmethod
-    def url_encode_figure(figure):
-        """Save graph into string buffer and convert 64 bit code into image."""
-        buf = io.BytesIO()
-        figure.savefig(buf, format="png")
-        buf.seek(0)
-        string = base64.b64encode(buf.read())
+    def svg_text(x, y, text, **attrs):
+        """Return an SVG text element of `text` at (`x`, `y`), with `attrs` as its presentation attributes."""
+        attributes = "".join(f' {name.replace("_", "-")}="{value}"' for name, value in attrs.items())
+        return f'<text x="{x:.1f}" y="{y:.1f}"{attributes}>{escape(str(text))}</text>'
+
+    @staticmethod
+    def svg_wedge_path(center_x, center_y, radius, theta1, theta2):
+        """Return the SVG path of a wedge going counterclockwise from `theta1` to `theta2` degrees."""
+        if theta2 - theta1 >= 360:
+            return (
+                f"M{center_x - radius:.1f},{center_y:.1f} "
+                f"A{radius:.1f},{radius:.1f} 0 1 0 {center_x + radius:.1f},{center_y:.1f} "
+                f"A{radius:.1f},{radius:.1f} 0 1 0 {center_x - radius:.1f},{center_y:.1f} Z"
+            )
+        # SVG y coordinates grow downwards, counterclockwise arcs are drawn with a sweep flag of 0.
+        start_x = center_x + radius * math.cos(math.radians(theta1))
+        start_y = center_y - radius * math.sin(math.radians(theta1))
+        end_x = center_x + radius * math.cos(math.radians(theta2))
+        end_y = center_y - radius * math.sin(math.radians(theta2))
+        large_arc = int(theta2 - theta1 > 180)
+        return (
+            f"M{center_x:.1f},{center_y:.1f} L{start_x:.1f},{start_y:.1f} "
+            f"A{radius:.1f},{radius:.1f} 0 {large_arc} 0 {end_x:.1f},{end_y:.1f} Z"
+        )
+
+    @staticmethod
+    def url_encode_svg(elements, width, height):
+        """Wrap SVG elements into an image of `width` by `height` pixels, quoted to be embedded in a data URL."""
+        svg = (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+            f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="DejaVu Sans, Arial, sans-serif" '
+            f'font-size="{CHART_FONT_SIZE}"><rect width="100%" height="100%" fill="white"/>{"".join(elements)}</svg>'
+        )
+        return urllib.parse.quote(svg)
+
+    @staticmethod
+    def integer_ticks(max_value, max_ticks=9):
+        """Return evenly spaced integer ticks from 0 to `max_value`, stepping by 1, 2 or 5 times a power of 10."""
+        step = next(
+            mult * 10**exp
+            for exp in itertools.count()
+            for mult in (1, 2, 5)
+            if max_value / (mult * 10**exp) < max_ticks
+        )
+        return range(0, int(max_value) + 1, step)
 
-        return urllib.parse.quote(string)
+    @staticmethod
+    def get_chart_cache_key(chart_type, *chart_data):
+        """Return the cache key of a chart of `chart_type` plotted from `chart_data`."""
+        digest = hashlib.blake2b(
+            json.dumps(
+                chart_data,
+                default=lambda value: dict(value) if isinstance(value, MappingProxyType) else str(value),
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+        return f"nautobot_device_lifecycle_mgmt:chart:{chart_type}:{digest}"
+
+    @staticmethod
+    def get_report_last_run(result_model):
+        """Return the time of the last full run of the report of `result_model` results, cached for a minute."""
+        return cache.get_or_set(
+            f"nautobot_device_lifecycle_mgmt:{result_model._meta.model_name}:last_run",
+            lambda: result_model.objects.filter(run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN)
+            .order_by("-last_updated")
+            .values_list("last_run", flat=True)
+            .first(),
+            REPORT_LAST_RUN_CACHE_TIMEOUT,
+        )
 
     @staticmethod
     def plot_piechart_visual(aggr, pie_chart_attrs):
-        """Plot pie chart aggregation visual."""
+        """Plot pie chart aggregation visual, caching it for identical aggregations."""
         if aggr[pie_chart_attrs["aggr_labels"][0]] is None:
             return None
 
+        return cache.get_or_set(
+            ReportOverviewHelper.get_chart_cache_key("piechart.svg", aggr, pie_chart_attrs),
+            lambda: ReportOverviewHelper.render_piechart_visual(aggr, pie_chart_attrs),
+            PLUGIN_CFG.get("chart_cache_timeout", 3600),
+        )
+
+    @staticmethod
+    def render_piechart_visual(aggr, pie_chart_attrs):  # pylint: disable=too-many-locals
+        """Render pie chart aggregation visual."""
         colors = [GREEN, RED, GREY]
         sizes = []
         pie_chart_labels = []
@@ -433,81 +549,197 @@ class ReportOverviewHelper(ContentTypePermissionRequiredMixin, generic.View):
             pie_chart_labels.append(chart_label)
             pie_chart_colors.append(color)
 
-        explode = len(sizes) * (0.1,)
-        fig1, ax1 = plt.subplots()
-        logging.debug(fig1)
-        ax1.pie(
-            sizes,
-            explode=explode,
-            labels=pie_chart_labels,
-            autopct="%1.1f%%",
-            colors=pie_chart_colors,
-            shadow=True,
-            startangle=90,
-            normalize=True,
+        # Wedges are drawn counterclockwise from 12 o'clock, each one exploded by a tenth of the radius along its
+        # bisector, with the label outside of the pie and the percentage inside of the wedge.
+        width, height = PIE_CHART_SIZE
+        center_x, center_y, radius = width / 2, height / 2, 0.32 * height
+        total = sum(sizes)
+        shadows, wedges, texts = [], [], []
+        theta1 = 90.0
+        for size, label, color in zip(sizes, pie_chart_labels, pie_chart_colors):
+            theta2 = theta1 + 360 * size / total
+            bisector = math.radians((theta1 + theta2) / 2)
+            direction_x, direction_y = math.cos(bisector), -math.sin(bisector)
+            wedge_x, wedge_y = center_x + 0.1 * radius * direction_x, center_y + 0.1 * radius * direction_y
+            path = ReportOverviewHelper.svg_wedge_path(wedge_x, wedge_y, radius, theta1, theta2)
+            shadows.append(
+                f'<path d="{path}" fill="black" fill-opacity="0.35" '
+                f'transform="translate({-0.02 * radius:.1f} {0.02 * radius:.1f})"/>'
+            )
+            wedges.append(f'<path d="{path}" fill="{color}"/>')
+            texts.append(
+                ReportOverviewHelper.svg_text(
+                    wedge_x + 1.1 * radius * direction_x,
+                    wedge_y + 1.1 * radius * direction_y,
+                    label,
+                    text_anchor="start" if direction_x > 0 else "end",
+                    dominant_baseline="central",
+                )
+            )
+            texts.append(
+                ReportOverviewHelper.svg_text(
+                    wedge_x + 0.6 * radius * direction_x,
+                    wedge_y + 0.6 * radius * direction_y,
+                    f"{100 * size / total:1.1f}%",
+                    text_anchor="middle",
+                    dominant_baseline="central",
+                )
+            )
+            theta1 = theta2
+        texts.append(
+            ReportOverviewHelper.svg_text(
+                center_x, 0.94 * height, aggr["name"], text_anchor="middle", font_size=CHART_TITLE_FONT_SIZE
+            )
         )
-        ax1.axis("equal")  # Equal aspect ratio ensures that pie is drawn as a circle.
-        plt.title(aggr["name"], y=-0.1)
-        fig = plt.gcf()
 
-        return ReportOverviewHelper.url_encode_figure(fig)
+        return ReportOverviewHelper.url_encode_svg(shadows + wedges + texts, width, height)
 
     @staticmethod
-    def plot_barchart_visual(qs, chart_attrs):  # pylint: disable=too-many-locals
-        """Construct report visual from queryset."""
-        labels = [item[chart_attrs["label_accessor"]] for item in qs]
-
-        label_locations = np.arange(len(labels))  # the label locations
-
-        barchart_bar_width = PLUGIN_CFG["barchart_bar_width"]
-        barchart_width = PLUGIN_CFG["barchart_width"]
-        barchart_height = PLUGIN_CFG["barchart_height"]
-
-        width = barchart_bar_width  # the width of the bars
-
-        fig, axis = plt.subplots(figsize=(barchart_width, barchart_height))
-
-        rects = []
-        for bar_pos, chart_bar in enumerate(chart_attrs["chart_bars"]):
-            bar_label_item = [item[chart_bar["data_attr"]] for item in qs]
-            rects.append(
-                axis.bar(
-                    label_locations - width + (bar_pos * width),
-                    bar_label_item,
-                    width,
-                    label=chart_bar["label"],
-                    color=chart_bar["color"],
+    def plot_barchart_visual(rows, chart_attrs):
+        """Construct report visual from aggregation rows, caching it for identical rows.
+
+        Args:
+            rows: list of tuples as returned by `read_aggr_rows`
+            chart_attrs: dict of chart title, labels and bar attributes
+        """
+        return cache.get_or_set(
+            ReportOverviewHelper.get_chart_cache_key(
+                "barchart.svg", rows, chart_attrs, BARCHART_BAR_WIDTH, BARCHART_SIZE
+            ),
+            lambda: ReportOverviewHelper.render_barchart_visual(rows, chart_attrs),
+            PLUGIN_CFG.get("chart_cache_timeout", 3600),
+        )
+
+    @staticmethod
+    def render_barchart_visual(rows, chart_attrs):  # pylint: disable=too-many-locals
+        """Render report visual from queryset rows.
+
+        Args:
+            rows: list of tuples holding the label of a group of bars followed by the height of each of its bars,
+                in the order of `chart_attrs["chart_bars"]`
+            chart_attrs: dict of chart title, labels and bar attributes
+        """
+        chart_bars = chart_attrs["chart_bars"]
+        width, height = BARCHART_SIZE
+        # Bounds of the plot area, in pixels.
+        left, right, top, bottom = 0.125 * width, 0.9 * width, 0.12 * height, 0.89 * height
+
+        # Groups of bars are centered on their label locations 0, 1, 2... The plot area fits the bars with a 20%
+        # margin on both sides and above the highest bar.
+        if rows:
+            first_bar = -BARCHART_BAR_WIDTH * 1.5
+            last_bar = len(rows) - 1 + (len(chart_bars) - 1.5) * BARCHART_BAR_WIDTH
+            margin = 0.2 * (last_bar - first_bar)
+            x_min, x_max = first_bar - margin, last_bar + margin
+            y_max = 1.2 * max(max(row[1:]) for row in rows) or 1
+        else:
+            x_min, x_max, y_max = 0, 1, 1
+
+        def x_pixel(x_value):
+            return left + (x_value - x_min) / (x_max - x_min) * (right - left)
+
+        def y_pixel(y_value):
+            return bottom - y_value / y_max * (bottom - top)
+
+        elements = []
+        for label_location, (label, *heights) in enumerate(rows):
+            for bar_pos, (chart_bar, bar_height) in enumerate(zip(chart_bars, heights)):
+                bar_center = x_pixel(label_location + (bar_pos - 1) * BARCHART_BAR_WIDTH)
+                bar_pixels = x_pixel(BARCHART_BAR_WIDTH) - x_pixel(0)
+                elements.append(
+                    f'<rect x="{bar_center - bar_pixels / 2:.1f}" y="{y_pixel(bar_height):.1f}" '
+                    f'width="{bar_pixels:.1f}" height="{bottom - y_pixel(bar_height):.1f}" fill="{chart_bar["color"]}"/>'
+                )
+                # Attach a text label at the bottom of each bar, displaying its height.
+                elements.append(
+                    ReportOverviewHelper.svg_text(
+                        bar_center,
+                        y_pixel(0.5) - 4,
+                        bar_height,
+                        text_anchor="start",
+                        dominant_baseline="central",
+                        transform=f"rotate(-90 {bar_center:.1f} {y_pixel(0.5) - 4:.1f})",
+                    )
+                )
+            # Custom x-axis tick labels
+            elements.append(
+                f'<line x1="{x_pixel(label_location):.1f}" y1="{bottom:.1f}" x2="{x_pixel(label_location):.1f}" '
+                f'y2="{bottom + 3.5:.1f}" stroke="black"/>'
+            )
+            elements.append(
+                ReportOverviewHelper.svg_text(
+                    x_pixel(label_location), bottom + 7, label, text_anchor="middle", dominant_baseline="hanging"
                 )
             )
 
-        # Add some text for labels, title and custom x-axis tick labels, etc.
-        axis.set_ylabel(chart_attrs["ylabel"])
-        axis.set_title(chart_attrs["title"])
-        axis.set_xticks(label_locations)
-        axis.set_xticklabels(labels, rotation=0)
-        # Force integer y-axis labels
-        axis.yaxis.set_major_locator(MaxNLocator(integer=True))
-        axis.margins(0.2, 0.2)
-        axis.legend()
-
-        def autolabel(rects):
-            """Attach a text label above each bar in *rects*, displaying its height."""
-            for rect in rects:
-                height = rect.get_height()
-                axis.annotate(
-                    f"{height}",
-                    xy=(rect.get_x() + rect.get_width() / 2, 0.5),
-                    xytext=(0, 3),  # 3 points vertical offset
-                    textcoords="offset points",
-                    ha="center",
-                    va="bottom",
-                    rotation=90,
+        # Integer y-axis labels
+        for tick in ReportOverviewHelper.integer_ticks(y_max):
+            elements.append(
+                f'<line x1="{left - 3.5:.1f}" y1="{y_pixel(tick):.1f}" x2="{left:.1f}" y2="{y_pixel(tick):.1f}" '
+                'stroke="black"/>'
+            )
+            elements.append(
+                ReportOverviewHelper.svg_text(
+                    left - 7, y_pixel(tick), tick, text_anchor="end", dominant_baseline="central"
                 )
+            )
+        elements.append(
+            f'<rect x="{left:.1f}" y="{top:.1f}" width="{right - left:.1f}" height="{bottom - top:.1f}" '
+            'fill="none" stroke="black" stroke-width="0.8"/>'
+        )
 
-        for rect in rects:
-            autolabel(rect)
+        # Add some text for labels, title and legend.
+        elements.append(
+            ReportOverviewHelper.svg_text(
+                left - 40,
+                (top + bottom) / 2,
+                chart_attrs["ylabel"],
+                text_anchor="middle",
+                transform=f"rotate(-90 {left - 40:.1f} {(top + bottom) / 2:.1f})",
+            )
+        )
+        elements.append(
+            ReportOverviewHelper.svg_text(
+                (left + right) / 2, top - 8, chart_attrs["title"], text_anchor="middle", font_size=CHART_TITLE_FONT_SIZE
+            )
+        )
+        legend_width = 50 + 0.6 * CHART_FONT_SIZE * max(len(chart_bar["label"]) for chart_bar in chart_bars)
+        legend_x, legend_y = right - 10 - legend_width, top + 10
+        elements.append(
+            f'<rect x="{legend_x:.1f}" y="{legend_y:.1f}" width="{legend_width:.1f}" '
+            f'height="{10 + 20 * len(chart_bars)}" rx="3" fill="white" fill-opacity="0.8" stroke="#CCCCCC"/>'
+        )
+        for bar_pos, chart_bar in enumerate(chart_bars):
+            entry_y = legend_y + 15 + 20 * bar_pos
+            elements.append(
+                f'<rect x="{legend_x + 8:.1f}" y="{entry_y - 5:.1f}" width="28" height="10" '
+                f'fill="{chart_bar["color"]}"/>'
+            )
+            elements.append(
+                ReportOverviewHelper.svg_text(legend_x + 44, entry_y, chart_bar["label"], dominant_baseline="central")
+            )
 
-        return ReportOverviewHelper.url_encode_figure(fig)
+        return ReportOverviewHelper.url_encode_svg(elements, width, height)
+
+    @staticmethod
+    def read_aggr_rows(aggr_rows, name, chart_attrs):
+        """Read the aggregation rows of a report in a single pass, streaming them from the database.
+
+        Returns:
+            aggr: dict of the summed aggregation fields, the given name and the valid percentage
+            rows: list of tuples holding the label of each row followed by its bar values, in the order of
+                `chart_attrs["chart_bars"]`
+        """
+        aggr_fields = ("total", "valid", "invalid", "no_software")
+        columns = [chart_attrs["label_accessor"]] + [chart_bar["data_attr"] for chart_bar in chart_attrs["chart_bars"]]
+        aggr = dict.fromkeys(aggr_fields, 0)
+        rows = []
+        for aggr_row in aggr_rows.iterator(chunk_size=500):
+            for field in aggr_fields:
+                aggr[field] += aggr_row[field]
+            rows.append(tuple(aggr_row[column] for column in columns))
+        aggr["name"] = name
+        return ReportOverviewHelper.calculate_aggr_percentage(aggr), rows
 
     @staticmethod
     def calculate_aggr_percentage(aggr):
@@ -533,13 +765,12 @@ class ValidatedSoftwareDeviceReportView(generic.ObjectListView):
     template_name = "nautobot_device_lifecycle_mgmt/validatedsoftware_device_report.html"
     queryset = (
         DeviceSoftwareValidationResult.objects.values("device__device_type__model")
-        .distinct()
         .annotate(
             total=Count("device__device_type__model"),
             valid=Count("device__device_type__model", filter=Q(is_validated=True)),
             invalid=Count("device__device_type__model", filter=Q(is_validated=False) & ~Q(software=None)),
             no_software=Count("device__device_type__model", filter=Q(software=None)),
-            valid_percent=ExpressionWrapper(100 * F("valid") / (F("total")), output_field=FloatField()),
+            valid_percent=VALID_PERCENT,
         )
         .order_by("-valid_percent")
     )
@@ -550,70 +781,29 @@ class ValidatedSoftwareDeviceReportView(generic.ObjectListView):
     def setup(self, request, *args, **kwargs):
         """Using request object to perform filtering based on query params."""
         super().setup(request, *args, **kwargs)  #
-        try:
-            report_last_run = (
-                DeviceSoftwareValidationResult.objects.filter(run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN)
-                .latest("last_updated")
-                .last_run
-            )
-        except DeviceSoftwareValidationResult.DoesNotExist:
-            report_last_run = None
+        report_last_run = ReportOverviewHelper.get_report_last_run(DeviceSoftwareValidationResult)
 
-        device_aggr = self.get_global_aggr(request)
         _platform_qs = (
             DeviceSoftwareValidationResult.objects.values("device__platform__name")
-            .distinct()
             .annotate(
-                total=Count("device__platform__name"),
-                valid=Count("device__platform__name", filter=Q(is_validated=True)),
-                invalid=Count("device__platform__name", filter=Q(is_validated=False) & ~Q(software=None)),
-                no_software=Count("device__platform__name", filter=Q(software=None)),
+                total=Count("device"),
+                valid=Count("device", filter=Q(is_validated=True)),
+                invalid=Count("device", filter=Q(is_validated=False) & ~Q(software=None)),
+                no_software=Count("device", filter=Q(software=None)),
             )
             .order_by("-total")
         )
-        platform_qs = self.filterset(request.GET, _platform_qs).qs
-        pie_chart_attrs = {
-            "aggr_labels": ["valid", "invalid", "no_software"],
-            "chart_labels": ["Valid", "Invalid", "No Software"],
-        }
-        bar_chart_attrs = {
-            "label_accessor": "device__platform__name",
-            "ylabel": "Device",
-            "title": "Valid per Platform",
-            "chart_bars": [
-                {"label": "Valid", "data_attr": "valid", "color": GREEN},
-                {"label": "Invalid", "data_attr": "invalid", "color": RED},
-                {"label": "No Software", "data_attr": "no_software", "color": GREY},
-            ],
-        }
+        # Devices without platform are counted in their own row, the platform rows add up to the global report.
+        device_aggr, platform_rows = ReportOverviewHelper.read_aggr_rows(
+            self.filterset(request.GET, _platform_qs).qs, "Devices", DEVICE_BAR_CHART_ATTRS
+        )
         self.extra_content = {
-            "bar_chart": ReportOverviewHelper.plot_barchart_visual(platform_qs, bar_chart_attrs),
+            "bar_chart": ReportOverviewHelper.plot_barchart_visual(platform_rows, DEVICE_BAR_CHART_ATTRS),
             "device_aggr": device_aggr,
-            "device_visual": ReportOverviewHelper.plot_piechart_visual(device_aggr, pie_chart_attrs),
+            "device_visual": ReportOverviewHelper.plot_piechart_visual(device_aggr, REPORT_PIE_CHART_ATTRS),
             "report_last_run": report_last_run,
         }
 
-    def get_global_aggr(self, request):
-        """Get device and inventory global reports.
-
-        Returns:
-            device_aggr: device global report dict
-        """
-        device_qs = DeviceSoftwareValidationResult.objects
-
-        device_aggr = {}
-        if self.filterset is not None:
-            device_aggr = self.filterset(request.GET, device_qs).qs.aggregate(
-                total=Count("device"),
-                valid=Count("device", filter=Q(is_validated=True)),
-                invalid=Count("device", filter=Q(is_validated=False) & ~Q(software=None)),
-                no_software=Count("device", filter=Q(software=None)),
-            )
-
-            device_aggr["name"] = "Devices"
-
-        return ReportOverviewHelper.calculate_aggr_percentage(device_aggr)
-
     def extra_context(self):
         """Extra content method on."""
         # add global aggregations to extra context.
@@ -665,13 +855,12 @@ class ValidatedSoftwareInventoryItemReportView(generic.ObjectListView):
     template_name = "nautobot_device_lifecycle_mgmt/validatedsoftware_inventoryitem_report.html"
     queryset = (
         InventoryItemSoftwareValidationResult.objects.values("inventory_item__part_id")
-        .distinct()
         .annotate(
             total=Count("inventory_item__part_id"),
             valid=Count("inventory_item__part_id", filter=Q(is_validated=True)),
             invalid=Count("inventory_item__part_id", filter=Q(is_validated=False) & ~Q(software=None)),
             no_software=Count("inventory_item__part_id", filter=Q(software=None)),
-            valid_percent=ExpressionWrapper(100 * F("valid") / (F("total")), output_field=FloatField()),
+            valid_percent=VALID_PERCENT,
         )
         .order_by("-valid_percent")
     )
@@ -682,73 +871,31 @@ class ValidatedSoftwareInventoryItemReportView(generic.ObjectListView):
     def setup(self, request, *args, **kwargs):
         """Using request object to perform filtering based on query params."""
         super().setup(request, *args, **kwargs)
-        try:
-            report_last_run = (
-                InventoryItemSoftwareValidationResult.objects.filter(
-                    run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN
-                )
-                .latest("last_updated")
-                .last_run
-            )
-        except InventoryItemSoftwareValidationResult.DoesNotExist:
-            report_last_run = None
+        report_last_run = ReportOverviewHelper.get_report_last_run(InventoryItemSoftwareValidationResult)
 
-        inventory_aggr = self.get_global_aggr(request)
         _platform_qs = (
             InventoryItemSoftwareValidationResult.objects.values("inventory_item__manufacturer__name")
-            .distinct()
             .annotate(
-                total=Count("inventory_item__manufacturer__name"),
-                valid=Count("inventory_item__manufacturer__name", filter=Q(is_validated=True)),
-                invalid=Count("inventory_item__manufacturer__name", filter=Q(is_validated=False) & ~Q(software=None)),
-                no_software=Count("inventory_item__manufacturer__name", filter=Q(software=None)),
+                total=Count("inventory_item"),
+                valid=Count("inventory_item", filter=Q(is_validated=True)),
+                invalid=Count("inventory_item", filter=Q(is_validated=False) & ~Q(software=None)),
+                no_software=Count("inventory_item", filter=Q(software=None)),
             )
             .order_by("-total")
         )
-        platform_qs = self.filterset(request.GET, _platform_qs).qs
-
-        pie_chart_attrs = {
-            "aggr_labels": ["valid", "invalid", "no_software"],
-            "chart_labels": ["Valid", "Invalid", "No Software"],
-        }
-        bar_chart_attrs = {
-            "label_accessor": "inventory_item__manufacturer__name",
-            "ylabel": "Inventory Item",
-            "title": "Valid per Manufacturer",
-            "chart_bars": [
-                {"label": "Valid", "data_attr": "valid", "color": GREEN},
-                {"label": "Invalid", "data_attr": "invalid", "color": RED},
-                {"label": "No Software", "data_attr": "no_software", "color": GREY},
-            ],
-        }
+        # Inventory items without manufacturer are counted in their own row, the manufacturer rows add up to the
+        # global report.
+        inventory_aggr, platform_rows = ReportOverviewHelper.read_aggr_rows(
+            self.filterset(request.GET, _platform_qs).qs, "Inventory Items", INVENTORY_ITEM_BAR_CHART_ATTRS
+        )
 
         self.extra_content = {
-            "bar_chart": ReportOverviewHelper.plot_barchart_visual(platform_qs, bar_chart_attrs),
+            "bar_chart": ReportOverviewHelper.plot_barchart_visual(platform_rows, INVENTORY_ITEM_BAR_CHART_ATTRS),
             "inventory_aggr": inventory_aggr,
-            "inventory_visual": ReportOverviewHelper.plot_piechart_visual(inventory_aggr, pie_chart_attrs),
+            "inventory_visual": ReportOverviewHelper.plot_piechart_visual(inventory_aggr, REPORT_PIE_CHART_ATTRS),
             "report_last_run": report_last_run,
         }
 
-    def get_global_aggr(self, request):
-        """Get device and inventory global reports.
-
-        Returns:
-            inventory_aggr: inventory item global report dict
-        """
-        inventory_item_qs = InventoryItemSoftwareValidationResult.objects
-
-        inventory_aggr = {}
-        if self.filterset is not None:
-            inventory_aggr = self.filterset(request.GET, inventory_item_qs).qs.aggregate(
-                total=Count("inventory_item"),
-                valid=Count("inventory_item", filter=Q(is_validated=True)),
-                invalid=Count("inventory_item", filter=Q(is_validated=False) & ~Q(software=None)),
-                no_software=Count("inventory_item", filter=Q(software=None)),
-            )
-            inventory_aggr["name"] = "Inventory Items"
-
-        return ReportOverviewHelper.calculate_aggr_percentage(inventory_aggr)
-
     def extra_context(self):
         """Extra content method on."""
         # add global aggregations to extra context.
@@ -799,7 +946,7 @@ class ValidatedSoftwareInventoryItemReportView(generic.ObjectListView):
 class ContractLCMListView(generic.ObjectListView):
     """List view."""
 
-    queryset = ContractLCM.objects.all()
+    queryset = ContractLCM.objects.select_related("provider")
     filterset = ContractLCMFilterSet
     filterset_form = ContractLCMFilterForm
     table = ContractLCMTable
@@ -816,14 +963,20 @@ class ContractLCMView(generic.ObjectView):
         request: The current request
         instance: The object being viewed
         """
+        contacts = []
+        owners = []
+        # One query for all the contacts of the contract, partitioned into owners and other points of contact.
+        for contact in (
+            ContactLCM.objects.restrict(request.user, "view").filter(contract=instance).order_by("type", "priority")
+        ):
+            if contact.type == choices.PoCTypeChoices.OWNER:
+                owners.append(contact)
+            else:
+                contacts.append(contact)
+
         return {
-            "contacts": ContactLCM.objects.restrict(request.user, "view")
-            .filter(contract=instance)
-            .exclude(type="Owner")
-            .order_by("type", "priority"),
-            "owners": ContactLCM.objects.restrict(request.user, "view")
-            .filter(contract=instance, type="Owner")
-            .order_by("type", "priority"),
+            "contacts": contacts,
+            "owners": owners,
         }
 
 
@@ -971,7 +1124,7 @@ class ProviderLCMBulkEditView(generic.BulkEditView):
 class ContactLCMListView(generic.ObjectListView):
     """List view."""
 
-    queryset = ContactLCM.objects.all()
+    queryset = ContactLCM.objects.select_related("contract")
     filterset = ContactLCMFilterSet
     filterset_form = ContactLCMFilterForm
     table = ContactLCMTable